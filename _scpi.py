@@ -0,0 +1,46 @@
+import pyvisa
+import time
+
+def parse_values(response: str, count: int):
+    """
+    Parses a combined SCPI response (';' or ',' separated) into a float array of count values.
+    Raises ValueError on an empty, short or non-numeric response.
+    """
+    import numpy as np
+    if response is None:
+        raise ValueError("No response to measurement query.")
+    try:
+        _values = np.array(response.strip().replace(";", ",").split(","), dtype=float)
+    except ValueError:
+        raise ValueError(f"Non-numeric measurement response: {response!r}")
+    if _values.size != count:
+        raise ValueError(f"Expected {count} measurement values, got {_values.size}: {response!r}")
+    return _values
+
+def poll(measure, rate: float, count: int, width: int):
+    """
+    Calls measure() at a fixed rate [Hz] and stacks the results into shape (count, 1 + width).
+    Column 0 is the host monotonic time [s] taken at the middle of each query.
+    Failed reads (VISA errors or bad responses) are filled with NaN.
+    """
+    import numpy as np
+    if rate <= 0:
+        raise ValueError(f"Poll rate must be positive, got {rate}.")
+    _period = 1.0 / rate
+    _samples = np.full((count, 1 + width), np.nan)
+    _next = time.monotonic()
+    for i in range(count):
+        _t0 = time.monotonic()
+        try:
+            _samples[i, 1:] = np.ravel(measure())
+        except (ValueError, pyvisa.VisaIOError) as e:
+            print(f"Measurement failed: {e}")
+        _t1 = time.monotonic()
+        _samples[i, 0] = (_t0 + _t1) / 2
+        _next += _period
+        _wait = _next - time.monotonic()
+        if _wait > 0:
+            time.sleep(_wait)
+        else:
+            _next = time.monotonic()  # fell behind, do not burst to catch up
+    return _samples
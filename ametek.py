@@ -1,9 +1,11 @@
 import pyvisa
 import time
+import _scpi
 
 class SEQUOIA():
     OUTPUT_ON = "OUTP 1"
     OUTPUT_OFF = "OUTP 0"
+    MEAS_FIELDS = ("voltage", "current", "power", "frequency")
 
     def __init__(self, ip: str):
         self.rm = pyvisa.ResourceManager()
@@ -14,7 +16,7 @@ class SEQUOIA():
         else:
             print("Failed to connect to instrument.")
         self.write("VOLT:RANGE 333")
-        self.phase = self.query("SYST:CONF:NOUT?")
+        self.phase = self._parse_phases(self.query("SYST:CONF:NOUT?"))
         self.voltage = float(self.query("VOLT?"))
         self.frequency = float(self.query("FREQ?"))
         self.output = self.query("OUTP?")
@@ -92,9 +94,40 @@ class SEQUOIA():
     
     def select_phase(self, num: int = 3):
         self.write(f"SYST:CONF:NOUT {num}")
-        self.phase = self.query("SYST:CONF:NOUT?")
+        self.phase = self._parse_phases(self.query("SYST:CONF:NOUT?"))
         return self.phase
 
+    def _parse_phases(self, response: str):
+        try:
+            return int(response)
+        except (TypeError, ValueError):
+            print("Error reading output phase count from device. Assuming 1.")
+            return 1
+
+    def measure(self, phases: int = None):
+        """
+        Reads measured voltage [Vrms], current [Arms], power [W] and frequency [Hz]
+        of every configured output phase in one query.
+        Returns a float array of shape (phases, 4) ordered as MEAS_FIELDS.
+        Raises ValueError if the response does not hold 4 values per phase.
+        """
+        if phases is None:
+            phases = self.phase
+        _cmd = ";".join(f":INST:NSEL {p};:MEAS:VOLT?;:MEAS:CURR?;:MEAS:POW?;:MEAS:FREQ?"
+                        for p in range(1, phases + 1))
+        _width = len(self.MEAS_FIELDS)
+        return _scpi.parse_values(self.query(_cmd), _width * phases).reshape(phases, _width)
+
+    def poll(self, rate: float, count: int):
+        """
+        Measures count times at rate [Hz].
+        Returns an array of shape (count, 1 + 4 * phases): host monotonic time [s],
+        then MEAS_FIELDS of phase 1, phase 2, ... Failed reads are filled with NaN.
+        The phase count is fixed for the whole run.
+        """
+        _phases = self.phase
+        return _scpi.poll(lambda: self.measure(_phases), rate, count, len(self.MEAS_FIELDS) * _phases)
+
     def switch_output(self, on: bool, delay: float = 0.0):
         time.sleep(delay)
         if on:
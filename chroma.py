@@ -1,8 +1,12 @@
 import pyvisa
 import time
+import _scpi
 
 ### Bidirectional DC Power Supply 62120D-1200 ###
 class BiDCPower():
+    MEAS_FIELDS = ("voltage", "current", "power")
+    MEAS_QUERY = "MEAS:VOLT?;:MEAS:CURR?;:MEAS:POW?"
+
     def __init__(self, ip: str):
         self.rm = pyvisa.ResourceManager()
         self.inst = self.rm.open_resource("TCPIP0::" + ip + "::INSTR")
@@ -127,12 +131,29 @@ class BiDCPower():
         self.load_current_lim = float(self.query("LOAD:CURR:PROT:HIGH?"))
         return self.load_current_lim
 
+    def measure(self):
+        """
+        Reads measured output voltage [V], current [A] and power [W] in one query.
+        Returns a float array ordered as MEAS_FIELDS.
+        Raises ValueError if the response is not len(MEAS_FIELDS) numbers.
+        """
+        return _scpi.parse_values(self.query(self.MEAS_QUERY), len(self.MEAS_FIELDS))
+
+    def poll(self, rate: float, count: int):
+        """
+        Measures count times at rate [Hz].
+        Returns an array of shape (count, 4): host monotonic time [s], then MEAS_FIELDS.
+        Failed reads are filled with NaN.
+        """
+        return _scpi.poll(self.measure, rate, count, len(self.MEAS_FIELDS))
+
 ### Regenerative Grid Simulator 61815 ###
 class GridSimulator():
     OUTPUT_ON = "OUTP ON"
     OUTPUT_OFF = "OUTP OFF"
+    MEAS_FIELDS = ("voltage", "current", "power", "frequency")
 
-    def __init__(self, ip: str):
+    def __init__(self, ip: str, phases: int = None):
         self.rm = pyvisa.ResourceManager()
         self.inst = self.rm.open_resource("TCPIP0::" + ip + "::INSTR")
         self.idn = self.query("*IDN?")
@@ -144,6 +165,9 @@ class GridSimulator():
         self.voltage = float(self.query("VOLT:AC?"))
         self.frequency = float(self.query("FREQ?"))
         self.output = self.query("OUTP?")
+        self.phases = None
+        if phases is not None:
+            self.set_measure_phases(phases)
         self.set_slew(1.0)
 
     def __del__(self):
@@ -205,6 +229,45 @@ class GridSimulator():
             self.output = False
         return self.output
 
+    def set_measure_phases(self, num: int):
+        """
+        Sets the number of output phases measure() reads (1 or 3).
+        Nothing is sent to the 61815; its phase mode is not read back,
+        so this must match the phase mode configured on the instrument.
+        """
+        if num not in (1, 3):
+            raise ValueError(f"Invalid phase count: {num}. Must be 1 or 3.")
+        self.phases = num
+        return self.phases
+
+    def measure(self, phases: int = None):
+        """
+        Reads measured voltage [Vrms], current [Arms], power [W] and frequency [Hz]
+        of every phase in one query.
+        Returns a float array of shape (phases, 4) ordered as MEAS_FIELDS.
+        Raises ValueError if the response does not hold 4 values per phase.
+        """
+        if phases is None:
+            phases = self.phases
+        if phases is None:
+            raise ValueError("Phase count unknown. Call set_measure_phases() first.")
+        _cmd = ";".join(f":INST:NSEL {p};:MEAS:VOLT:AC?;:MEAS:CURR:AC?;:MEAS:POW:AC?;:MEAS:FREQ?"
+                        for p in range(1, phases + 1))
+        _width = len(self.MEAS_FIELDS)
+        return _scpi.parse_values(self.query(_cmd), _width * phases).reshape(phases, _width)
+
+    def poll(self, rate: float, count: int):
+        """
+        Measures count times at rate [Hz].
+        Returns an array of shape (count, 1 + 4 * phases): host monotonic time [s],
+        then MEAS_FIELDS of phase 1, phase 2, ... Failed reads are filled with NaN.
+        The phase count is fixed for the whole run.
+        """
+        _phases = self.phases
+        if _phases is None:
+            raise ValueError("Phase count unknown. Call set_measure_phases() first.")
+        return _scpi.poll(lambda: self.measure(_phases), rate, count, len(self.MEAS_FIELDS) * _phases)
+
 
 if __name__ == "__main__":
     chroma = BiDCPower("192.168.0.35")
@@ -118,6 +118,23 @@ class WaveRunner():
         print(_ret)
         return _ret
     
+    def arm(self):
+        """
+        Clears the acquisition flag and arms a single acquisition.
+        """
+        self.query("INR?")
+        return self.write("ARM")
+
+    def triggered(self):
+        """
+        Returns True once a new acquisition has completed since the last call (INR bit 0).
+        Reading INR clears the flag.
+        """
+        try:
+            return bool(int(self.query("INR?").split()[-1]) & 1)
+        except (AttributeError, IndexError, ValueError):
+            return False
+
     def set_trigger_level(self, level, chan: str = ""):
         _cmd = chan+":TRIG_LEVEL "+str(level)
         self.write(_cmd)
@@ -137,6 +154,7 @@ class WaveRunner():
     def get_time_series_data(self, chan: str = "C1", len: int = 5000000): # len = 5000000 for 20 seconds
         """
         Gets a waveform with its corresponding time on the current screen.
+        The time axis is relative to the trigger point (t = 0 at the trigger).
         """
         _waveform = np.array(self.inst.GetScaledWaveformWithTimes(chan, len, 0))
         _waveform = np.transpose(_waveform)
@@ -0,0 +1,271 @@
+import time
+import statistics
+import numpy as np
+import pandas as pd
+
+class Timeline:
+    """
+    Puts commands and acquisitions of several instruments on one host-monotonic timeline.
+
+    Every instrument is attached with a name. Its write/query calls and its acquisitions
+    (measure, poll, get_time_series_data) are then stamped with time.monotonic(), corrected
+    by the one-way link latency estimated from round trips. None of the drivers expose the
+    instrument clock, so the per-instrument offset is that latency.
+
+    Measured streams (oscilloscope waveforms, supply and WT5000 poll() results, ...) are added
+    with the offset of their own time axis and can be aligned on a shared time grid.
+    Adding to an existing stream name appends a new segment, e.g. one waveform per step.
+    """
+    STAMPED = ("write", "query")
+    ACQUISITIONS = ("measure", "poll", "get_time_series_data")
+
+    def __init__(self, rounds: int = 10):
+        """
+        Args:
+            rounds (int): Number of *OPC? round trips used to estimate the latency.
+        """
+        self.rounds = rounds
+        self.devices = {}   # name -> attached instrument
+        self.latency = {}   # name -> estimated one-way latency [s]
+        self.jitter = {}    # name -> standard deviation of the round trip time [s]
+        self.events = []    # (time, rtt, name, kind, message)
+        self.streams = {}   # name -> DataFrame with "time" and "segment" columns
+        self._muted = set()
+
+    def calibrate(self, name: str, dev):
+        """
+        Estimates the one-way latency of dev as half of the median *OPC? round trip time.
+        """
+        _rtt = []
+        self._muted.add(name)
+        try:
+            for _ in range(self.rounds):
+                _t0 = time.monotonic()
+                dev.query("*OPC?")
+                _rtt.append(time.monotonic() - _t0)
+        finally:
+            self._muted.discard(name)
+        self.latency[name] = statistics.median(_rtt) / 2
+        self.jitter[name] = statistics.pstdev(_rtt)
+        return self.latency[name]
+
+    def attach(self, name: str, dev, calibrate: bool = True):
+        """
+        Stamps every command and acquisition of dev from now on.
+        A command is stamped at its send time plus the estimated latency, i.e. when the
+        instrument got it. An acquisition is stamped when it was requested, with its duration
+        in the rtt column. poll() rows carry their own sample times.
+        """
+        if name in self.devices:
+            raise ValueError(f"Instrument name already attached: {name}")
+        if getattr(dev, "_timeline", None) is not None:
+            raise ValueError("Instrument is already attached to a timeline. Call detach() first.")
+        if calibrate:
+            self.calibrate(name, dev)
+        else:
+            self.latency[name] = 0.0
+            self.jitter[name] = 0.0
+
+        for attr in self.STAMPED + self.ACQUISITIONS:
+            if hasattr(dev, attr):
+                kind = attr if attr in self.STAMPED else "acquire"
+                setattr(dev, attr, self._wrap(name, kind, getattr(dev, attr), attr in self.STAMPED))
+        dev._timeline = self
+        self.devices[name] = dev
+        return dev
+
+    def detach(self, name: str):
+        """
+        Restores the original methods of the instrument attached as name.
+        """
+        dev = self.devices.pop(name)
+        self.latency.pop(name, None)
+        self.jitter.pop(name, None)
+        for attr in self.STAMPED + self.ACQUISITIONS:
+            if attr in vars(dev):
+                delattr(dev, attr)
+        dev._timeline = None
+        return dev
+
+    def _wrap(self, name: str, kind: str, func, has_message: bool):
+        def stamped(*args, **kwargs):
+            if name in self._muted:  # nested call, e.g. query -> write or poll -> measure
+                return func(*args, **kwargs)
+            self._muted.add(name)
+            _t0 = time.monotonic()
+            try:
+                _ret = func(*args, **kwargs)
+            finally:
+                self._muted.discard(name)
+            if has_message:
+                _msg = args[0] if args else kwargs.get("msg", "")
+            else:
+                _msg = func.__name__
+            self.stamp(name, kind, _msg, _t0 + self.latency[name], time.monotonic() - _t0)
+            return _ret
+        return stamped
+
+    def stamp(self, name: str, kind: str, message: str = "", t: float = None, rtt: float = np.nan):
+        """
+        Records an event manually. t defaults to the current host monotonic time.
+        """
+        if t is None:
+            t = time.monotonic()
+        self.events.append((t, rtt, name, kind, message))
+        return t
+
+    def get_events(self):
+        return pd.DataFrame(self.events, columns=["time", "rtt", "instrument", "kind", "message"])
+
+    def arm(self, name: str):
+        """
+        Arms a single acquisition on the oscilloscope attached as name (WaveRunner.arm).
+        """
+        self._muted.add(name)
+        _t0 = time.monotonic()
+        try:
+            self.devices[name].arm()
+        finally:
+            self._muted.discard(name)
+        return self.stamp(name, "arm", "ARM", _t0 + self.latency[name], time.monotonic() - _t0)
+
+    def wait_acquisition(self, name: str, timeout: float = 60.0, interval: float = 0.001, delay: float = 0.0):
+        """
+        Polls the oscilloscope attached as name until the armed acquisition has completed.
+
+        Returns the host time the scope reported the acquisition as done (INR bit 0), minus delay.
+        It lies between the last negative and the first positive poll; the width of that
+        window is stored in the rtt column of the "acquired" event.
+        The scope sets the flag only after processing the record, so without delay this is an
+        upper bound on the time of the last sample and shifts the waveform late.
+        delay [s] is the scope's processing time for the current record length, e.g. measured
+        once with a known edge. Pass the result as end= to add_stream.
+        """
+        dev = self.devices[name]
+        _arms = [e[0] for e in self.events if e[2] == name and e[3] == "arm"]
+        _t_neg = _arms[-1] if _arms else time.monotonic()
+        _deadline = time.monotonic() + timeout
+        self._muted.add(name)
+        try:
+            while True:
+                _t0 = time.monotonic()
+                if dev.triggered():
+                    _t_pos = _t0 + self.latency[name]
+                    break
+                _t_neg = _t0 + self.latency[name]
+                if _t0 > _deadline:
+                    raise TimeoutError(f"No acquisition on {name} within {timeout} s.")
+                time.sleep(interval)
+        finally:
+            self._muted.discard(name)
+        return self.stamp(name, "acquired", "INR?", (_t_neg + _t_pos) / 2 - delay, _t_pos - _t_neg)
+
+    def add_stream(self, name: str, data, offset: float = 0.0, end: float = None, columns: list = None, replace: bool = False):
+        """
+        Adds a measured stream to the timeline.
+        If name already holds a stream, data is appended as a new segment (numbered in the
+        "segment" column), so one waveform per arm/acquire step can be collected under one name.
+        Segments are never interpolated into each other.
+
+        Args:
+            name (str): Stream name, used as column prefix when aligning.
+            data: DataFrame with a "time" row (WaveRunner.get_time_series_data) or column,
+                or an array whose first column is time (poll() results).
+            offset (float): Host monotonic time of t = 0 of the stream's own time axis.
+                0 for host-stamped data such as poll() results.
+            end (float): Host monotonic time of the last sample, e.g. from wait_acquisition.
+                Overrides offset; used for oscilloscope waveforms whose time axis is
+                relative to the trigger.
+            columns (list): Names of the value columns of an array. Defaults to MEAS_FIELDS
+                of the instrument attached as name. A list shorter than the data is repeated
+                per phase as voltage1, current1, ..., voltage2, ...
+            replace (bool): Drop the segments already stored under name.
+        """
+        if isinstance(data, pd.DataFrame):
+            _df = data.T if "time" in data.index else data
+            _df = _df.reset_index(drop=True)
+        else:
+            _arr = np.asarray(data, dtype=float)
+            _width = _arr.shape[1] - 1
+            if columns is None:
+                columns = getattr(self.devices.get(name), "MEAS_FIELDS", None)
+            if columns is None:
+                columns = [str(i) for i in range(1, _width + 1)]
+            elif len(columns) != _width:
+                if _width % len(columns):
+                    raise ValueError(f"{len(columns)} column names do not fit {_width} value columns.")
+                columns = [f"{c}{p}" for p in range(1, _width // len(columns) + 1) for c in columns]
+            _df = pd.DataFrame(_arr[:, 1:], columns=list(columns))
+            _df.insert(0, "time", _arr[:, 0])
+        _df = _df.astype(float).sort_values("time", ignore_index=True)
+        if end is not None:
+            offset = end - _df["time"].iloc[-1]
+        _df["time"] = _df["time"] + offset
+        if replace or name not in self.streams:
+            _df["segment"] = 0
+            self.streams[name] = _df
+        else:
+            _df["segment"] = self.streams[name]["segment"].iloc[-1] + 1
+            self.streams[name] = pd.concat([self.streams[name], _df], ignore_index=True)
+        return self.streams[name]
+
+    def _segments(self, df: pd.DataFrame):
+        _seg = df["segment"].to_numpy()
+        _bounds = np.flatnonzero(np.diff(_seg)) + 1
+        return zip(np.r_[0, _bounds], np.r_[_bounds, len(_seg)])
+
+    def align(self, period: float, names: list = None):
+        """
+        Resamples the given streams (all by default) onto one time grid with step period [s]
+        by linear interpolation. The grid covers the span where all streams overlap.
+        Grid points outside every segment of a stream (gaps between acquisitions) are NaN.
+        """
+        names = list(self.streams) if names is None else names
+        _start = max(self.streams[n]["time"].min() for n in names)
+        _stop = min(self.streams[n]["time"].max() for n in names)
+        if _stop < _start:
+            raise ValueError("Streams do not overlap in time.")
+        _grid = np.arange(_start, _stop + period / 2, period)
+        _aligned = {"time": _grid}
+        for n in names:
+            _df = self.streams[n]
+            _t = _df["time"].to_numpy()
+            for col in _df.columns.drop(["time", "segment"]):
+                _v = _df[col].to_numpy()
+                _out = np.full(len(_grid), np.nan)
+                for a, b in self._segments(_df):
+                    lo = np.searchsorted(_grid, _t[a])
+                    hi = np.searchsorted(_grid, _t[b - 1], side="right")
+                    _out[lo:hi] = np.interp(_grid[lo:hi], _t[a:b], _v[a:b])
+                _aligned[f"{n}:{col}"] = _out
+        return pd.DataFrame(_aligned)
+
+    def response_times(self, stream: str, column: str, threshold: float, instrument: str, command: str = "", rising: bool = True):
+        """
+        Time from each command sent to instrument (write messages starting with command)
+        to the first threshold crossing of stream[column] after it.
+        Crossings are searched within each segment, so a stream collected over many
+        arm/acquire steps gives one response per step in a single call.
+        A command gets NaN if no crossing happens before the next command.
+        """
+        _ev = self.get_events()
+        _ev = _ev[(_ev["instrument"] == instrument) & (_ev["kind"] == "write")
+                  & _ev["message"].str.startswith(command)]
+        _cmd_t = np.sort(_ev["time"].to_numpy())
+
+        _df = self.streams[stream]
+        _t = _df["time"].to_numpy()
+        _above = _df[column].to_numpy() >= threshold
+        if not rising:
+            _above = ~_above
+        _seg = _df["segment"].to_numpy()
+        _edges = np.flatnonzero(~_above[:-1] & _above[1:] & (_seg[:-1] == _seg[1:])) + 1
+        _edge_t = np.sort(_t[_edges])
+
+        _idx = np.searchsorted(_edge_t, _cmd_t)
+        _valid = _idx < len(_edge_t)
+        _resp = np.full(len(_cmd_t), np.nan)
+        _resp[_valid] = _edge_t[_idx[_valid]] - _cmd_t[_valid]
+        _next_cmd = np.append(_cmd_t[1:], np.inf)
+        _resp[_cmd_t + _resp >= _next_cmd] = np.nan
+        return pd.DataFrame({"time": _cmd_t, "response": _resp})
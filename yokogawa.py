@@ -1,10 +1,12 @@
 import pyvisa
 import os
+import _scpi
 
 class WT5000:
     """
     Class to control WT5000 instrument via PyVISA.
     """
+    MEAS_FIELDS = ()
 
     def __init__(self, ip: str, verbose: bool = True):
         """
@@ -87,6 +89,45 @@ class WT5000:
         """
         self.write("IMAG:EXEC")
 
+    def set_numeric_items(self, items: list = (("U", 1), ("I", 1), ("P", 1))):
+        """
+        Set the numeric items read by measure().
+
+        Args:
+            items (list): (function, element) pairs, e.g. ("U", 1) for the voltage of element 1.
+                The names in MEAS_FIELDS are function + element, e.g. "U1".
+        """
+        self.write("COMM:HEAD OFF")
+        self.write("NUM:FORM ASC")
+        self.write(f"NUM:NORM:NUM {len(items)}")
+        for i, (func, elem) in enumerate(items, start=1):
+            self.write(f"NUM:NORM:ITEM{i} {func},{elem}")
+        self.MEAS_FIELDS = tuple(f"{func}{elem}" for func, elem in items)
+        return self.MEAS_FIELDS
+
+    def measure(self):
+        """
+        Read all numeric items set by set_numeric_items() in one query (NUM:NORM:VAL?).
+        Returns a float array ordered as MEAS_FIELDS.
+        Raises ValueError if no items are set or the response does not hold one value per item.
+        """
+        if not self.MEAS_FIELDS:
+            raise ValueError("No numeric items set. Call set_numeric_items() first.")
+        return _scpi.parse_values(self.query("NUM:NORM:VAL?"), len(self.MEAS_FIELDS))
+
+    def poll(self, rate: float, count: int):
+        """
+        Measure count times at rate [Hz].
+        The values only change at the instrument's data update rate, so faster polling repeats them.
+
+        Returns:
+            Array of shape (count, 1 + len(MEAS_FIELDS)): host monotonic time [s], then MEAS_FIELDS.
+            Failed reads are filled with NaN.
+        """
+        if not self.MEAS_FIELDS:
+            raise ValueError("No numeric items set. Call set_numeric_items() first.")
+        return _scpi.poll(self.measure, rate, count, len(self.MEAS_FIELDS))
+
 if __name__ == "__main__":
     wt = WT5000("192.168.0.5")
     # print(wt.query("FILE:PATH?"))